@@ -1,55 +1,390 @@
 from pathlib import Path
-import tempfile
-import shutil
+import argparse
+import concurrent.futures
+import io
 import os
 import sys
+import zipfile
+import numpy as np
 import pandas as pd
-from openpyxl import load_workbook
-from openpyxl.styles import Font, PatternFill, Alignment
-from openpyxl.drawing.image import Image as ExcelImage
 import datetime
 
 
 
-# Try to import matplotlib; if unavailable, charts will be skipped
+# Try to import matplotlib; if unavailable, charts will be skipped.
+# The Figure/FigureCanvasAgg API is used instead of pyplot: no GUI backend
+# probing, no global state, and rendering is thread-safe.
 try:
-    import matplotlib.pyplot as plt
+    import matplotlib
+    matplotlib.use("Agg")
+    from matplotlib.figure import Figure
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
     HAVE_MPL = True
 except Exception:
     HAVE_MPL = False
     # Do not exit; continue without charting
 
-def auto_adjust_column_width(ws, min_width=8, max_width=50):
-    """Auto-fit column widths for an openpyxl worksheet."""
-    for col in ws.columns:
-        try:
-            col_letter = col[0].column_letter
-        except Exception:
-            continue
-        max_length = 0
-        for cell in col:
-            try:
-                if cell.value is None:
+# Try to import pyarrow; its multithreaded CSV reader beats pd.read_csv on big files
+try:
+    import pyarrow.csv as pacsv
+    HAVE_PYARROW = True
+except Exception:
+    HAVE_PYARROW = False
+
+# Try to import lxml; if unavailable, large raw sheets go through the normal writer
+try:
+    from lxml import etree
+    HAVE_LXML = True
+except Exception:
+    HAVE_LXML = False
+
+# Try to import polars; it backs the optional backend="polars" fast path
+try:
+    import polars as pl
+    HAVE_POLARS = True
+except Exception:
+    HAVE_POLARS = False
+
+# Try to import numba; when present the Year pivots use a one-pass JIT kernel
+try:
+    import numba
+    HAVE_NUMBA = True
+except Exception:
+    HAVE_NUMBA = False
+
+if HAVE_NUMBA:
+    @numba.njit(parallel=True)
+    def _group_mean_max_min(codes, vals, n_groups):
+        """Grouped mean/max/min in one pass with per-thread accumulators."""
+        n_threads = numba.get_num_threads()
+        sums = np.zeros((n_threads, n_groups))
+        counts = np.zeros((n_threads, n_groups), dtype=np.int64)
+        maxs = np.full((n_threads, n_groups), -np.inf)
+        mins = np.full((n_threads, n_groups), np.inf)
+        n = vals.shape[0]
+        chunk = (n + n_threads - 1) // n_threads
+        for t in numba.prange(n_threads):
+            start = t * chunk
+            stop = min(n, start + chunk)
+            for i in range(start, stop):
+                c = codes[i]
+                v = vals[i]
+                if c < 0 or np.isnan(v):
                     continue
-                val = str(cell.value)
-                if len(val) > max_length:
-                    max_length = len(val)
-            except Exception:
-                pass
-        width = max(min_width, min(max_length + 2, max_width))
-        ws.column_dimensions[col_letter].width = width
+                sums[t, c] += v
+                counts[t, c] += 1
+                if v > maxs[t, c]:
+                    maxs[t, c] = v
+                if v < mins[t, c]:
+                    mins[t, c] = v
+        mean = np.empty(n_groups)
+        vmax = np.empty(n_groups)
+        vmin = np.empty(n_groups)
+        for g in range(n_groups):
+            cnt = counts[:, g].sum()
+            if cnt > 0:
+                mean[g] = sums[:, g].sum() / cnt
+                vmax[g] = maxs[:, g].max()
+                vmin[g] = mins[:, g].min()
+            else:
+                mean[g] = np.nan
+                vmax[g] = np.nan
+                vmin[g] = np.nan
+        return mean, vmax, vmin
+
+# Row count above which the Raw Data sheet is streamed as hand-built XML
+RAW_XML_MIN_ROWS = 100_000
+
+# Shared header style; turned into a single format object per workbook,
+# so every header cell reuses one style id in the stylesheet
+HEADER_FORMAT = {
+    "bold": True,
+    "bg_color": "#4F81BD",
+    "font_color": "white",
+    "align": "center",
+    "valign": "vcenter",
+}
+
+_MAIN_NS = "http://schemas.openxmlformats.org/spreadsheetml/2006/main"
+_REL_NS = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+_PKG_REL_NS = "http://schemas.openxmlformats.org/package/2006/relationships"
+_CT_NS = "http://schemas.openxmlformats.org/package/2006/content-types"
+_XML_SPACE = "{http://www.w3.org/XML/1998/namespace}space"
+
+
+def _column_letters(n):
+    """Return the first n Excel column letters (A, B, ..., AA, AB, ...)."""
+    letters = []
+    for i in range(n):
+        s = ""
+        while True:
+            s = chr(65 + i % 26) + s
+            i = i // 26 - 1
+            if i < 0:
+                break
+        letters.append(s)
+    return letters
+
+
+def _write_raw_sheet_xml(excel_path, df, sheet_name="Raw Data"):
+    """Stream df into excel_path as a new first sheet built directly as XML.
+
+    Bypasses the per-cell writer objects entirely: the workbook zip is
+    rewritten with the workbook/rels/content-type parts patched, and the
+    sheet XML is emitted incrementally with lxml from the dataframe rows.
+    The streamed sheet carries no header styling or column widths.
+    """
+    excel_path = Path(excel_path)
+    tmp_path = excel_path.with_name(excel_path.name + ".tmp")
+    part_name = "xl/worksheets/sheetRaw.xml"
+    rel_id = "rIdRawData"
+    q = lambda tag: f"{{{_MAIN_NS}}}{tag}"
+
+    letters = _column_letters(len(df.columns))
+    numeric = []
+    for col in df.columns:
+        dtype = df[col].dtype
+        if isinstance(dtype, pd.CategoricalDtype):
+            dtype = dtype.categories.dtype
+        # bools count as numeric dtypes but str(True) is not a valid <v>
+        # payload, so route them through the inline-string path
+        numeric.append(pd.api.types.is_numeric_dtype(dtype)
+                       and not pd.api.types.is_bool_dtype(dtype))
+
+    with zipfile.ZipFile(excel_path) as zin, \
+            zipfile.ZipFile(tmp_path, "w", zipfile.ZIP_DEFLATED) as zout:
+        for item in zin.infolist():
+            data = zin.read(item.filename)
+            if item.filename == "xl/workbook.xml":
+                root = etree.fromstring(data)
+                sheets_el = root.find(q("sheets"))
+                sheet_ids = [int(s.get("sheetId")) for s in sheets_el]
+                el = etree.SubElement(sheets_el, q("sheet"))
+                el.set("name", sheet_name)
+                el.set("sheetId", str(max(sheet_ids, default=0) + 1))
+                el.set(f"{{{_REL_NS}}}id", rel_id)
+                sheets_el.insert(0, el)
+                data = etree.tostring(root, xml_declaration=True, encoding="UTF-8", standalone=True)
+            elif item.filename == "xl/_rels/workbook.xml.rels":
+                root = etree.fromstring(data)
+                rel = etree.SubElement(root, f"{{{_PKG_REL_NS}}}Relationship")
+                rel.set("Id", rel_id)
+                rel.set("Type", _REL_NS + "/worksheet")
+                rel.set("Target", "worksheets/sheetRaw.xml")
+                data = etree.tostring(root, xml_declaration=True, encoding="UTF-8", standalone=True)
+            elif item.filename == "[Content_Types].xml":
+                root = etree.fromstring(data)
+                ov = etree.SubElement(root, f"{{{_CT_NS}}}Override")
+                ov.set("PartName", "/" + part_name)
+                ov.set("ContentType",
+                       "application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml")
+                data = etree.tostring(root, xml_declaration=True, encoding="UTF-8", standalone=True)
+            zout.writestr(item, data)
+
+        with zout.open(part_name, "w") as fh, etree.xmlfile(fh, encoding="UTF-8") as xf:
+            xf.write_declaration(standalone=True)
+            with xf.element(q("worksheet"), nsmap={None: _MAIN_NS}):
+                with xf.element(q("sheetData")):
+                    header = etree.Element(q("row"), r="1")
+                    for letter, name in zip(letters, df.columns):
+                        c = etree.SubElement(header, q("c"), r=letter + "1", t="inlineStr")
+                        t = etree.SubElement(etree.SubElement(c, q("is")), q("t"))
+                        t.text = str(name)
+                        if t.text != t.text.strip():
+                            # stop Excel collapsing the outer whitespace
+                            t.set(_XML_SPACE, "preserve")
+                    xf.write(header)
+                    for r, values in enumerate(df.itertuples(index=False, name=None), start=2):
+                        rs = str(r)
+                        row = etree.Element(q("row"), r=rs)
+                        for i, val in enumerate(values):
+                            if val is None or pd.isna(val):
+                                continue
+                            if numeric[i]:
+                                c = etree.SubElement(row, q("c"), r=letters[i] + rs)
+                                etree.SubElement(c, q("v")).text = str(val)
+                            else:
+                                c = etree.SubElement(row, q("c"), r=letters[i] + rs, t="inlineStr")
+                                t = etree.SubElement(etree.SubElement(c, q("is")), q("t"))
+                                t.text = str(val)
+                                if t.text != t.text.strip():
+                                    t.set(_XML_SPACE, "preserve")
+                        xf.write(row)
+
+    os.replace(tmp_path, excel_path)
+
+def auto_adjust_column_width(worksheet, frame, min_width=8, max_width=50, include_index=False):
+    """Fit column widths on an xlsxwriter worksheet from the source dataframe.
+
+    Widths come from vectorized string-length maxima over the dataframe
+    rather than a Python-level scan of every cell.
+    """
+    header_widths = frame.columns.astype(str).str.len().to_numpy()
+    if len(frame):
+        value_widths = frame.astype(str).apply(lambda s: s.str.len().max()).to_numpy(dtype=float)
+    else:
+        value_widths = np.zeros(len(frame.columns))
+    widths = np.clip(np.maximum(header_widths, np.nan_to_num(value_widths)) + 2,
+                     min_width, max_width)
+    offset = 0
+    if include_index:
+        index_width = len(str(frame.index.name or ""))
+        if len(frame):
+            index_width = max(index_width, int(frame.index.astype(str).str.len().max()))
+        worksheet.set_column(0, 0, int(np.clip(index_width + 2, min_width, max_width)))
+        offset = 1
+    for i, width in enumerate(widths):
+        worksheet.set_column(offset + i, offset + i, int(width))
+
+def _stream_frame(worksheet, frame, header_format, include_index=False):
+    """Stream a dataframe into an xlsxwriter worksheet row by row.
+
+    The header goes out first with its format, then each data row is
+    appended with write_row, skipping to_excel's intermediate cell
+    structures. xlsxwriter still buffers the written cells until save
+    (constant_memory mode is off).
+    """
+    headers = [str(c) for c in frame.columns]
+    if include_index:
+        headers = [str(frame.index.name or "")] + headers
+    worksheet.write_row(0, 0, headers, header_format)
+    for r, values in enumerate(frame.itertuples(index=include_index, name=None), start=1):
+        worksheet.write_row(
+            r, 0, [None if v is None or v is pd.NA or v != v else v for v in values])
+
+def _render_wind_chart(pivot_wind):
+    """Render the mean-wind-by-year line chart; returns a PNG buffer."""
+    fig = Figure(figsize=(8, 4), dpi=96)
+    ax = fig.add_subplot()
+    ax.plot(pivot_wind["Year"], pivot_wind["Mean"], marker="o")
+    ax.set_title("Average Wind Speed by Year")
+    ax.set_xlabel("Year")
+    ax.set_ylabel("Wind")
+    ax.grid(True, linestyle="--", alpha=0.4)
+    fig.tight_layout()
+    buf = io.BytesIO()
+    FigureCanvasAgg(fig).print_png(buf, metadata={"Software": None})
+    return buf
+
+
+def _render_precip_chart(pivot_precip):
+    """Render the total-precipitation-by-year bar chart; returns a PNG buffer."""
+    fig = Figure(figsize=(8, 4), dpi=96)
+    ax = fig.add_subplot()
+    ax.bar(pivot_precip["Year"].astype(str), pivot_precip["Total"])
+    ax.set_title("Total Precipitation by Year")
+    ax.set_xlabel("Year")
+    ax.set_ylabel("Precipitation (mm)")
+    fig.tight_layout()
+    buf = io.BytesIO()
+    FigureCanvasAgg(fig).print_png(buf, metadata={"Software": None})
+    return buf
+
+
+def _label_counts(df):
+    """Count occurrences of each Label value.
+
+    Counting happens over the small integer category codes (a bincount)
+    instead of hashing every string, then sorts the handful of distinct
+    labels by count as value_counts would.
+    """
+    labels = df["Label"].astype("category")
+    codes = labels.cat.codes.to_numpy()
+    counts = np.bincount(codes[codes >= 0], minlength=len(labels.cat.categories))
+    return (pd.DataFrame({"Label": labels.cat.categories, "Count": counts})
+            .sort_values("Count", ascending=False, ignore_index=True))
+
+
+def _missing_summary(df):
+    """Missing-value count per column, without materializing a full NxM mask."""
+    return pd.DataFrame({
+        "Column": df.columns,
+        "MissingCount": (len(df) - df.count()).to_numpy(),
+    })
+
+
+def _polars_load_and_pivot(csv_path):
+    """Load the CSV and build the Year pivots with polars' columnar engine.
+
+    Returns (df, pivot_wind, pivot_temp, pivot_precip) with df and the
+    pivots converted to pandas for the shared writing pipeline.
+    """
+    lf = pl.scan_csv(str(csv_path))
+    keep = [c for c in lf.collect_schema().names() if not c.lower().startswith("unnamed")]
+    lf = lf.select(keep)
+    if "Year" in keep:
+        lf = lf.sort("Year")
+    data = lf.collect(engine="streaming")
+
+    if "Year" in keep:
+        year = data["Year"]
+        if year.dtype.is_float():
+            whole = year.drop_nulls()
+            if (whole == whole.floor()).all():
+                data = data.with_columns(pl.col("Year").cast(pl.Int32))
+        aggs = []
+        for col in ("Wind", "Temperature"):
+            aggs += [
+                pl.col(col).mean().alias(f"{col}_Mean"),
+                pl.col(col).max().alias(f"{col}_Max"),
+                pl.col(col).min().alias(f"{col}_Min"),
+            ]
+        if "Precipitation_mm" in keep:
+            aggs.append(pl.col("Precipitation_mm").sum().alias("Precip_Total"))
+        grouped = (data.filter(pl.col("Year").is_not_null())
+                   .group_by("Year").agg(aggs).sort("Year").to_pandas())
+        pivot_wind = grouped[["Year", "Wind_Mean", "Wind_Max", "Wind_Min"]].rename(
+            columns=lambda c: c.replace("Wind_", ""))
+        pivot_temp = grouped[["Year", "Temperature_Mean", "Temperature_Max",
+                              "Temperature_Min"]].rename(
+            columns=lambda c: c.replace("Temperature_", ""))
+        if "Precipitation_mm" in keep:
+            pivot_precip = grouped[["Year", "Precip_Total"]].rename(
+                columns={"Precip_Total": "Total"})
+        else:
+            pivot_precip = pd.DataFrame(columns=["Year", "Total"])
+    else:
+        pivot_wind = pd.DataFrame({"Message": ["No 'Year' column available"]})
+        pivot_temp = pd.DataFrame({"Message": ["No 'Year' column available"]})
+        pivot_precip = pd.DataFrame({"Message": ["No 'Year' column available"]})
+
+    return data.to_pandas(), pivot_wind, pivot_temp, pivot_precip
+
+
+def _column_stats(df):
+    """Per-column descriptive statistics for the Statistics sheet."""
+    # decode numeric-valued categoricals (e.g. the Year grouping column)
+    # so they land in the numeric bucket, as they did pre-cast
+    decoded = {}
+    for col in df.columns:
+        dtype = df[col].dtype
+        if (isinstance(dtype, pd.CategoricalDtype)
+                and pd.api.types.is_numeric_dtype(dtype.categories.dtype)):
+            decoded[col] = df[col].astype(dtype.categories.dtype)
+    if decoded:
+        df = df.assign(**decoded)
+    num = df.select_dtypes("number")
+    stats = pd.DataFrame({
+        "count": num.count(),
+        "mean": num.mean(),
+        "std": num.std(),
+        "min": num.min(),
+        "max": num.max(),
+    })
+    other = df.drop(columns=num.columns)
+    if not other.empty:
+        stats = pd.concat([
+            stats,
+            pd.DataFrame({"count": other.count(), "unique": other.nunique()}),
+        ])
+    return stats
 
-def style_header_row(ws, header_fill_hex="4F81BD"):
-    """Apply header style to first row of worksheet."""
-    for cell in ws[1]:
-        cell.font = Font(bold=True, color="FFFFFF")
-        cell.fill = PatternFill(start_color=header_fill_hex, fill_type="solid")
-        cell.alignment = Alignment(horizontal="center", vertical="center")
 
 def generate_excel_report(csv_path=None,
                           excel_path=None,
                           use_file_dialog=False,
-                          embed_charts=True):
+                          embed_charts=True,
+                          backend="pandas"):
     
     # Optionally import tkinter only when needed (to avoid issues in headless envs)
     if use_file_dialog:
@@ -91,171 +426,229 @@ def generate_excel_report(csv_path=None,
         excel_path = csv_path.with_name("Final_Report.xlsx")
     excel_path = Path(excel_path).expanduser()
 
-    # Create a temporary directory for charts
-    tmpdir = Path(tempfile.mkdtemp(prefix="excel_report_tmp_"))
-
-    try:
-        # Load CSV (robust reading)
-        df = pd.read_csv(csv_path, low_memory=False)
+    if backend == "polars":
+        # Columnar multithreaded fast path: read, filter and aggregate in
+        # polars, then hand pandas frames to the shared writing pipeline
+        if not HAVE_POLARS:
+            raise RuntimeError("polars is not installed. Use backend='pandas'.")
+        df, pivot_wind, pivot_temp, pivot_precip = _polars_load_and_pivot(csv_path)
+    else:
+        # Load CSV (multithreaded pyarrow reader when available)
+        if HAVE_PYARROW:
+            read_options = pacsv.ReadOptions(use_threads=True, block_size=1 << 20)
+            # blank string fields are null, matching pd.read_csv
+            convert_options = pacsv.ConvertOptions(strings_can_be_null=True)
+            table = pacsv.read_csv(str(csv_path), read_options=read_options,
+                                   convert_options=convert_options)
+            df = table.to_pandas(types_mapper=pd.ArrowDtype)
+        else:
+            df = pd.read_csv(csv_path)
 
         # Basic cleaning: drop unnamed columns created by Excel exports
-        df = df.loc[:, ~df.columns.str.contains('^Unnamed', case=False)]
+        keep = [c for c in df.columns if not str(c).lower().startswith("unnamed")]
+        if len(keep) != len(df.columns):
+            df = df[keep]
 
-        # If Year column is numeric with .0 values convert to ints when safe
+        # Normalize Year to an ordered categorical over Int32 codes when safe:
+        # 1-byte codes instead of 8-byte keys, and groupby needs no hashing
         if "Year" in df.columns:
             try:
-                # drop NA rows for conversion check
-                if pd.api.types.is_float_dtype(df["Year"]) and df["Year"].dropna().apply(float.is_integer).all():
-                    df["Year"] = df["Year"].astype("Int64")
-                elif pd.api.types.is_object_dtype(df["Year"]):
+                year = df["Year"]
+                if pd.api.types.is_object_dtype(year) or pd.api.types.is_string_dtype(year):
                     # attempt converting strings like '2023.0'
-                    df["Year"] = pd.to_numeric(df["Year"], errors="ignore")
+                    year = pd.to_numeric(year)
+                # whole-number check runs vectorized, skipping NA entries
+                if pd.api.types.is_float_dtype(year):
+                    vals = year.to_numpy(dtype="float64", na_value=np.nan)
+                    vals = vals[~np.isnan(vals)]
+                    if np.all(np.floor(vals) == vals):
+                        year = year.astype("Int32")
+                if pd.api.types.is_integer_dtype(year):
+                    df["Year"] = pd.Categorical(year.astype("Int32"), ordered=True)
             except Exception:
                 pass
 
-        # Group by Year (if present) and compute pivot-like summaries
+        # Sort once on Year up front; the groupbys below can then skip their
+        # own output sort and still come out in year order
+        if "Year" in df.columns:
+            df = df.sort_values("Year", kind="stable", ignore_index=True)
+
+        # Group by Year (if present) and compute pivot-like summaries in a
+        # single fused aggregation pass
         if "Year" in df.columns:
-            grouped = df.groupby("Year")
-            pivot_wind = grouped["Wind"].agg(Mean="mean", Max="max", Min="min").reset_index()
-            pivot_temp = grouped["Temperature"].agg(Mean="mean", Max="max", Min="min").reset_index()
-            if "Precipitation_mm" in df.columns:
-                pivot_precip = grouped["Precipitation_mm"].agg(Total="sum").reset_index()
+            if HAVE_NUMBA:
+                # Hand-rolled group reduce: one cache-friendly pass per column
+                codes, years = pd.factorize(df["Year"], sort=True)
+                n_groups = len(years)
+                pivots = {}
+                for col in ("Wind", "Temperature"):
+                    vals = df[col].to_numpy(dtype="float64", na_value=np.nan)
+                    mean, vmax, vmin = _group_mean_max_min(codes, vals, n_groups)
+                    pivots[col] = pd.DataFrame(
+                        {"Year": years, "Mean": mean, "Max": vmax, "Min": vmin})
+                pivot_wind = pivots["Wind"]
+                pivot_temp = pivots["Temperature"]
+                if "Precipitation_mm" in df.columns:
+                    vals = df["Precipitation_mm"].to_numpy(dtype="float64", na_value=np.nan)
+                    mask = (codes >= 0) & ~np.isnan(vals)
+                    totals = np.bincount(codes[mask], weights=vals[mask], minlength=n_groups)
+                    pivot_precip = pd.DataFrame({"Year": years, "Total": totals})
+                else:
+                    pivot_precip = pd.DataFrame(columns=["Year", "Total"])
             else:
-                pivot_precip = pd.DataFrame(columns=["Year", "Total"])
+                agg_cols = {"Wind": ["mean", "max", "min"], "Temperature": ["mean", "max", "min"]}
+                if "Precipitation_mm" in df.columns:
+                    agg_cols["Precipitation_mm"] = ["sum"]
+                grouped = df.groupby("Year", sort=False, observed=True).agg(agg_cols)
+                stat_names = {"mean": "Mean", "max": "Max", "min": "Min", "sum": "Total"}
+                pivot_wind = grouped["Wind"].rename(columns=stat_names).reset_index()
+                pivot_temp = grouped["Temperature"].rename(columns=stat_names).reset_index()
+                if "Precipitation_mm" in df.columns:
+                    pivot_precip = grouped["Precipitation_mm"].rename(columns=stat_names).reset_index()
+                else:
+                    pivot_precip = pd.DataFrame(columns=["Year", "Total"])
+            # Convert the categorical Year back to plain ints for display
+            if isinstance(df["Year"].dtype, pd.CategoricalDtype):
+                year_dtype = df["Year"].cat.categories.dtype
+                for pivot in (pivot_wind, pivot_temp, pivot_precip):
+                    if "Year" in pivot.columns and len(pivot):
+                        pivot["Year"] = pivot["Year"].astype(year_dtype)
         else:
             pivot_wind = pd.DataFrame({"Message": ["No 'Year' column available"]})
             pivot_temp = pd.DataFrame({"Message": ["No 'Year' column available"]})
             pivot_precip = pd.DataFrame({"Message": ["No 'Year' column available"]})
 
-        # Label counts
-        label_counts = None
-        if "Label" in df.columns:
-            label_counts = df["Label"].value_counts().rename_axis("Label").reset_index(name="Count")
-
-        # Missing value summary
-        missing_summary = df.isna().sum().to_frame(name="MissingCount")
-        missing_summary.index.name = "Column"
-        missing_summary = missing_summary.reset_index()
-
-        # Descriptive statistics
-        stats = df.describe(include="all").transpose()
-
-        # Write to Excel
-        with pd.ExcelWriter(excel_path, engine="openpyxl") as writer:
-            df.to_excel(writer, index=False, sheet_name="Raw Data")
-            pivot_wind.to_excel(writer, index=False, sheet_name="Wind Summary")
-            pivot_temp.to_excel(writer, index=False, sheet_name="Temperature Summary")
-            pivot_precip.to_excel(writer, index=False, sheet_name="Precipitation Summary")
-            stats.to_excel(writer, sheet_name="Statistics")
-            missing_summary.to_excel(writer, index=False, sheet_name="Missing Values")
-            if label_counts is not None:
-                label_counts.to_excel(writer, index=False, sheet_name="Label Summary")
-
-        # Load workbook for styling and embedding charts
-        wb = load_workbook(excel_path)
-
-        # Style all sheets and adjust widths
-        for sheetname in wb.sheetnames:
-            ws = wb[sheetname]
+    # Run the independent summaries and chart rendering concurrently;
+    # every task only reads df or the pivots
+    with concurrent.futures.ThreadPoolExecutor(max_workers=4) as ex:
+        chart_futures = []
+        if embed_charts and HAVE_MPL and "Year" in df.columns:
+            if not pivot_wind.empty and "Mean" in pivot_wind.columns:
+                chart_futures.append(ex.submit(_render_wind_chart, pivot_wind))
+            if not pivot_precip.empty and "Total" in pivot_precip.columns:
+                chart_futures.append(ex.submit(_render_precip_chart, pivot_precip))
+        label_future = ex.submit(_label_counts, df) if "Label" in df.columns else None
+        missing_future = ex.submit(_missing_summary, df)
+        stats_future = ex.submit(_column_stats, df)
+
+        label_counts = label_future.result() if label_future is not None else None
+        missing_summary = missing_future.result()
+        stats = stats_future.result()
+        chart_images = []
+        for fut in chart_futures:
+            try:
+                chart_images.append(fut.result())
+            except Exception as e:
+                # if chart creation fails, continue without crashing
+                print("Warning: failed to create charts:", e)
+
+    # Very large raw sheets are streamed as hand-built XML after the
+    # styled workbook is written
+    stream_raw = HAVE_LXML and len(df) > RAW_XML_MIN_ROWS
+
+    # Write to Excel; style headers and widths inside the same writer
+    # context. The default date format keeps date columns readable on the
+    # write_row path, which applies no format of its own.
+    with pd.ExcelWriter(
+            excel_path, engine="xlsxwriter",
+            engine_kwargs={"options": {"default_date_format": "yyyy-mm-dd"}}) as writer:
+        # Single format object shared by every header cell
+        header_format = writer.book.add_format(HEADER_FORMAT)
+        sheets = [
+            ("Wind Summary", pivot_wind, False),
+            ("Temperature Summary", pivot_temp, False),
+            ("Precipitation Summary", pivot_precip, False),
+            ("Statistics", stats, True),
+            ("Missing Values", missing_summary, False),
+        ]
+        if label_counts is not None:
+            sheets.append(("Label Summary", label_counts, False))
+
+        # Raw Data is streamed row by row rather than routed through
+        # to_excel's cell table; first so it stays the leading sheet
+        if not stream_raw:
+            raw_ws = writer.book.add_worksheet("Raw Data")
+            _stream_frame(raw_ws, df, header_format)
             try:
-                style_header_row(ws)
+                auto_adjust_column_width(raw_ws, df)
             except Exception:
                 pass
+
+        # Summary sheets are small but take the same streamed path;
+        # skipping to_excel's per-cell type inference adds up across them
+        for sheet_name, frame, with_index in sheets:
+            worksheet = writer.book.add_worksheet(sheet_name)
+            _stream_frame(worksheet, frame, header_format, include_index=with_index)
             try:
-                auto_adjust_column_width(ws)
+                auto_adjust_column_width(worksheet, frame, include_index=with_index)
             except Exception:
                 pass
 
-        # Create charts if requested and matplotlib is available
-        chart_files = []
-        if embed_charts and HAVE_MPL and "Year" in df.columns:
+        # Add a Charts sheet then embed the rendered images there,
+        # straight from the in-memory buffers
+        if chart_images:
             try:
-                # Wind trend (mean wind by year)
-                wind_mean = df.groupby("Year")["Wind"].mean().reset_index()
-                if not wind_mean.empty:
-                    p = tmpdir / "wind_trend.png"
-                    plt.figure(figsize=(8,4))
-                    plt.plot(wind_mean["Year"], wind_mean["Wind"], marker="o")
-                    plt.title("Average Wind Speed by Year")
-                    plt.xlabel("Year")
-                    plt.ylabel("Wind")
-                    plt.grid(True, linestyle="--", alpha=0.4)
-                    plt.tight_layout()
-                    plt.savefig(p, dpi=150, bbox_inches="tight")
-                    plt.close()
-                    chart_files.append(p)
-
-                # Precipitation total by year (if column exists)
-                if "Precipitation_mm" in df.columns:
-                    precip_total = df.groupby("Year")["Precipitation_mm"].sum().reset_index()
-                    if not precip_total.empty:
-                        p2 = tmpdir / "precip_total.png"
-                        plt.figure(figsize=(8,4))
-                        plt.bar(precip_total["Year"].astype(str), precip_total["Precipitation_mm"])
-                        plt.title("Total Precipitation by Year")
-                        plt.xlabel("Year")
-                        plt.ylabel("Precipitation (mm)")
-                        plt.tight_layout()
-                        plt.savefig(p2, dpi=150, bbox_inches="tight")
-                        plt.close()
-                        chart_files.append(p2)
-
-                # Add a Charts sheet then embed images there
-                if chart_files:
-                    if "Charts" in wb.sheetnames:
-                        chart_ws = wb["Charts"]
-                    else:
-                        chart_ws = wb.create_sheet("Charts")
-                    # Place images spaced downwards
-                    row_offset = 2
-                    for i, img_path in enumerate(chart_files):
-                        img = ExcelImage(str(img_path))
-                        anchor_cell = f"A{row_offset + i*25}"
-                        chart_ws.add_image(img, anchor_cell)
+                chart_ws = writer.book.add_worksheet("Charts")
+                # Place images spaced downwards
+                row_offset = 2
+                for i, buf in enumerate(chart_images):
+                    anchor_cell = f"A{row_offset + i*25}"
+                    chart_ws.insert_image(anchor_cell, f"chart{i + 1}.png",
+                                          {"image_data": buf})
             except Exception as e:
-                # if chart creation or embedding fails, continue without crashing
-                print("Warning: failed to create/insert charts:", e)
+                # if embedding fails, continue without crashing
+                print("Warning: failed to insert charts:", e)
 
-        # Save workbook after styling/embedding
-        wb.save(excel_path)
+    # Stream the raw sheet into the finished workbook for large inputs
+    if stream_raw:
+        _write_raw_sheet_xml(excel_path, df)
 
-        print(f"Excel report generated: {excel_path}")
+    print(f"Excel report generated: {excel_path}")
 
-        # Return path for convenience
-        return str(excel_path)
-
-    finally:
-        # Cleanup tmpdir
-        try:
-            shutil.rmtree(tmpdir)
-        except Exception:
-            pass
+    # Return path for convenience
+    return str(excel_path)
 
 
 if __name__ == "__main__":
-    csv_default = r"C:\Czekanowsky\Czekanowsky\czekanowsky\Datasets.csv"
-    excel_default = r"C:\Users\Mahesh mm\Documents\Final_Report.xlsx"
-
-    # Recommended: change to True if you prefer to pick files via GUI dialogs
-    use_gui_dialogs = False
+    parser = argparse.ArgumentParser(
+        description="Generate a styled Excel report from a CSV file.")
+    parser.add_argument("csv", nargs="?",
+                        help="input CSV file (may be omitted with --gui)")
+    parser.add_argument("-o", "--output",
+                        help="output .xlsx path (default: Final_Report.xlsx next to the CSV)")
+    parser.add_argument("--timestamped", action="store_true",
+                        help="append a timestamp to the output file name")
+    parser.add_argument("--gui", action="store_true",
+                        help="pick the input/output files via dialogs")
+    parser.add_argument("--no-charts", action="store_true",
+                        help="skip chart rendering and embedding")
+    parser.add_argument("--backend", choices=["pandas", "polars"], default="pandas",
+                        help="dataframe engine for the heavy steps")
+    args = parser.parse_args()
+
+    if args.csv is None and not args.gui:
+        parser.error("a CSV path is required unless --gui is given")
+
+    output = args.output
+    if args.timestamped:
+        if output is not None:
+            base = Path(output)
+        elif args.csv is not None:
+            base = Path(args.csv).with_name("Final_Report.xlsx")
+        else:
+            parser.error("--timestamped needs a CSV path or --output")
+        timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
+        output = base.with_name(f"{base.stem}_{timestamp}{base.suffix}")
 
     # If matplotlib is not installed, charts will be skipped automatically.
     try:
         generate_excel_report(
-            csv_path=csv_default if not use_gui_dialogs else None,
-            excel_path=excel_default if not use_gui_dialogs else None,
-            use_file_dialog=use_gui_dialogs,
-            embed_charts=True
+            csv_path=args.csv,
+            excel_path=output,
+            use_file_dialog=args.gui,
+            embed_charts=not args.no_charts,
+            backend=args.backend,
         )
     except Exception as err:
         print("ERROR:", err)
         sys.exit(1)
-
-if __name__ == "__main__":
-    timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
-    output_path = f"C:/Users/Mahesh mm/Documents/Final_Report_{timestamp}.xlsx"
-    generate_excel_report(
-        "C:/Czekanowsky/Czekanowsky/czekanowsky/Datasets.csv",
-        output_path
-    )
-    print(f"✅ Report saved to: {output_path}")